@@ -3,22 +3,66 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
+import io
 import json
 import os
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+_INPUTS_HASH_PREFIX = "// Inputs SHA-256: "
+
+
+def _inputs_hash(in_paths: List[Path]) -> str:
+    h = hashlib.sha256()
+    for p in [Path(__file__), *in_paths]:
+        data = p.read_bytes()
+        h.update(b"%d\n" % len(data))
+        h.update(data)
+    return h.hexdigest()
+
+
+def _recorded_inputs_hash(out_path: Path) -> Optional[str]:
+    try:
+        with out_path.open("r", encoding="utf-8") as f:
+            for _ in range(4):
+                line = f.readline()
+                if line.startswith(_INPUTS_HASH_PREFIX):
+                    return line[len(_INPUTS_HASH_PREFIX):].strip()
+    except (OSError, UnicodeDecodeError):
+        pass
+    return None
+
 
 def _emit(path: Path, text: str) -> None:
+    data = text.encode("utf-8")
+    if path.is_file() and path.read_bytes() == data:
+        return
     path.parent.mkdir(parents=True, exist_ok=True)
     tmp = path.with_suffix(path.suffix + ".tmp")
-    with tmp.open("w", encoding="utf-8", newline="\n") as f:
-        f.write(text)
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
     os.replace(tmp, path)
 
 
+_C_STRING_ESCAPES = str.maketrans({"\\": "\\\\", '"': '\\"'})
+
+
 def _escape_c_string(s: str) -> str:
-    return s.replace("\\", "\\\\").replace('"', '\\"')
+    return s.translate(_C_STRING_ESCAPES)
 
 
 def main(argv: Optional[List[str]] = None) -> int:
@@ -35,41 +79,52 @@ def main(argv: Optional[List[str]] = None) -> int:
         default=Path("src/openmeta/geotiff_key_names_generated.inc"),
         help="Output C++ include with a static key-id -> name table.",
     )
+    ap.add_argument(
+        "--force",
+        action="store_true",
+        help="Regenerate even if the output records the current inputs hash.",
+    )
     args = ap.parse_args(argv)
 
+    inputs_hash = _inputs_hash([args.in_path])
+    if not args.force and _recorded_inputs_hash(args.out_inc) == inputs_hash:
+        return 0
+
+    rows: List[Tuple[int, str]] = []
+    for line in args.in_path.read_bytes().splitlines():
+        if not line or line.isspace():
+            continue
+        rec = _json_loads(line)
+        if rec.get("kind") != "geotiff.key":
+            continue
+        key_id = rec.get("key_id")
+        if not isinstance(key_id, int) or key_id < 0 or key_id > 0xFFFF:
+            continue
+        name = rec.get("name", "")
+        if not isinstance(name, str) or not name:
+            continue
+
+        rows.append((key_id, name))
+
+    # Sorting puts the lexicographically smallest name first for each key id.
+    rows.sort()
     table: Dict[int, str] = {}
-    with args.in_path.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            rec = json.loads(line)
-            if rec.get("kind") != "geotiff.key":
-                continue
-            key_id = rec.get("key_id")
-            if not isinstance(key_id, int) or key_id < 0 or key_id > 0xFFFF:
-                continue
-            name = rec.get("name", "")
-            if not isinstance(name, str) or not name:
-                continue
-
-            prev = table.get(key_id)
-            if prev is None or name < prev:
-                table[key_id] = name
-
-    items: List[Tuple[int, str]] = sorted(table.items(), key=lambda kv: kv[0])
-
-    out: List[str] = []
-    out.append("// Generated file. Do not edit by hand.\n")
-    out.append("// Generated from: registry/geotiff/keys.jsonl\n\n")
-    out.append("static constexpr GeotiffKeyNameEntry kGeotiffKeys[] = {\n")
+    for key_id, name in rows:
+        table.setdefault(key_id, name)
+
+    items: List[Tuple[int, str]] = sorted(table.items())
+
+    buf = io.StringIO()
+    w = buf.write
+    w("// Generated file. Do not edit by hand.\n")
+    w("// Generated from: registry/geotiff/keys.jsonl\n")
+    w("%s%s\n\n" % (_INPUTS_HASH_PREFIX, inputs_hash))
+    w("static constexpr GeotiffKeyNameEntry kGeotiffKeys[] = {\n")
     for key_id, name in items:
-        out.append(
-            f"    {{ {key_id}u, \"{_escape_c_string(name)}\" }},\n"
-        )
-    out.append("};\n")
+        w('    { %du, "%s" },\n' % (key_id, _escape_c_string(name)))
+    w("};\n")
 
-    _emit(args.out_inc, "".join(out))
+    _emit(args.out_inc, buf.getvalue())
     return 0
 
 
@@ -3,12 +3,23 @@
 from __future__ import annotations
 
 import argparse
+import functools
+import hashlib
+import io
 import json
 import os
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+try:
+    import orjson
 
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+@functools.lru_cache(maxsize=None)
 def _cpp_ident(name: str) -> str:
     out: List[str] = []
     cap_next = True
@@ -21,16 +32,53 @@ def _cpp_ident(name: str) -> str:
     return "".join(out) if out else "Unknown"
 
 
+_INPUTS_HASH_PREFIX = "// Inputs SHA-256: "
+
+
+def _inputs_hash(in_paths: List[Path]) -> str:
+    # Covers this script too, so generator changes also force a rewrite.
+    h = hashlib.sha256()
+    for p in [Path(__file__), *in_paths]:
+        data = p.read_bytes()
+        h.update(b"%d\n" % len(data))
+        h.update(data)
+    return h.hexdigest()
+
+
+def _recorded_inputs_hash(out_path: Path) -> Optional[str]:
+    try:
+        with out_path.open("r", encoding="utf-8") as f:
+            for _ in range(4):
+                line = f.readline()
+                if line.startswith(_INPUTS_HASH_PREFIX):
+                    return line[len(_INPUTS_HASH_PREFIX):].strip()
+    except (OSError, UnicodeDecodeError):
+        pass
+    return None
+
+
 def _emit(path: Path, text: str) -> None:
+    data = text.encode("utf-8")
+    if path.is_file() and path.read_bytes() == data:
+        # Leave the file (and its mtime) alone so dependents do not rebuild.
+        return
     path.parent.mkdir(parents=True, exist_ok=True)
     tmp = path.with_suffix(path.suffix + ".tmp")
-    with tmp.open("w", encoding="utf-8", newline="\n") as f:
-        f.write(text)
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
     os.replace(tmp, path)
 
 
+_C_STRING_ESCAPES = str.maketrans({"\\": "\\\\", '"': '\\"'})
+
+
 def _escape_c_string(s: str) -> str:
-    return s.replace("\\", "\\\\").replace('"', '\\"')
+    return s.translate(_C_STRING_ESCAPES)
 
 
 def main(argv: Optional[List[str]] = None) -> int:
@@ -47,9 +95,15 @@ def main(argv: Optional[List[str]] = None) -> int:
         default=Path("src/openmeta/exif_makernote_tag_names_generated.inc"),
         help="Output C++ include with static tag-name tables.",
     )
+    ap.add_argument(
+        "--force",
+        action="store_true",
+        help="Regenerate even if the output records the current inputs hash.",
+    )
     args = ap.parse_args(argv)
 
-    tables: Dict[str, Dict[int, str]] = {}
+    # (ifd, tag) -> name; duplicates keep the lexicographically smallest name.
+    flat: Dict[Tuple[str, int], str] = {}
 
     paths: List[Path] = []
     if args.in_path.is_dir():
@@ -57,53 +111,64 @@ def main(argv: Optional[List[str]] = None) -> int:
     else:
         paths = [args.in_path]
 
-    for path in paths:
-        with path.open("r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                rec = json.loads(line)
-                if rec.get("kind") != "exif.tag":
-                    continue
-                ifd = rec.get("ifd", "")
-
-                tag_s = rec.get("tag", "")
-                if not tag_s:
-                    continue
-                tag = int(tag_s, 16)
-                if tag < 0 or tag > 0xFFFF:
-                    continue
-
-                name = rec.get("name", "")
-                if not name:
-                    continue
-
-                d = tables.setdefault(ifd, {})
-                prev = d.get(tag)
-                if prev is None or name < prev:
-                    d[tag] = name
-
-    out: List[str] = []
-    out.append("// Generated file. Do not edit by hand.\n")
-    out.append("// Generated from: registry/exif/makernotes/*.jsonl\n\n")
+    inputs_hash = _inputs_hash(paths)
+    if not args.force and _recorded_inputs_hash(args.out_inc) == inputs_hash:
+        return 0
 
-    for ifd in sorted(tables.keys()):
-        items: List[Tuple[int, str]] = sorted(tables[ifd].items(), key=lambda kv: kv[0])
+    for path in paths:
+        for line in path.read_bytes().splitlines():
+            if not line or line.isspace():
+                continue
+            rec = _json_loads(line)
+            if rec.get("kind") != "exif.tag":
+                continue
+            ifd = rec.get("ifd", "")
+
+            tag_s = rec.get("tag", "")
+            if not tag_s:
+                continue
+            tag = int(tag_s, 16)
+            if tag < 0 or tag > 0xFFFF:
+                continue
+
+            name = rec.get("name", "")
+            if not name:
+                continue
+
+            key = (ifd, tag)
+            prev = flat.get(key)
+            if prev is None or name < prev:
+                flat[key] = name
+
+    # Group by IFD only once, in sorted (ifd, tag) order.
+    tables: Dict[str, List[Tuple[int, str]]] = {}
+    for (ifd, tag), name in sorted(flat.items()):
+        items = tables.get(ifd)
+        if items is None:
+            items = tables[ifd] = []
+        items.append((tag, name))
+
+    buf = io.StringIO()
+    w = buf.write
+    w("// Generated file. Do not edit by hand.\n")
+    w("// Generated from: registry/exif/makernotes/*.jsonl\n")
+    w("%s%s\n\n" % (_INPUTS_HASH_PREFIX, inputs_hash))
+
+    for ifd, items in tables.items():
         ident = _cpp_ident(ifd)
-        out.append(f"static constexpr MakerNoteTagNameEntry k{ident}[] = {{\n")
+        w("static constexpr MakerNoteTagNameEntry k%s[] = {\n" % ident)
         for tag, name in items:
-            out.append(f"    {{ 0x{tag:04X}u, \"{_escape_c_string(name)}\" }},\n")
-        out.append("};\n\n")
+            w('    { 0x%04Xu, "%s" },\n' % (tag, _escape_c_string(name)))
+        w("};\n\n")
 
-    out.append("static constexpr MakerNoteTableMap kMakerNoteTables[] = {\n")
-    for ifd in sorted(tables.keys()):
+    w("static constexpr MakerNoteTableMap kMakerNoteTables[] = {\n")
+    for ifd, items in tables.items():
         ident = _cpp_ident(ifd)
-        count = len(tables[ifd])
-        out.append(f"    {{ \"{ifd}\", k{ident}, {count}u }},\n")
-    out.append("};\n")
+        count = len(items)
+        w('    { "%s", k%s, %du },\n' % (ifd, ident, count))
+    w("};\n")
 
-    _emit(args.out_inc, "".join(out))
+    _emit(args.out_inc, buf.getvalue())
     return 0
 
 
@@ -124,6 +124,9 @@ def main(argv: list[str]) -> int:
         openmeta.C2paVerifyBackend.Native: "native",
         openmeta.C2paVerifyBackend.OpenSsl: "openssl",
     }
+    # Output directories already created in this run; a batch into one
+    # --out-dir only needs a single makedirs call.
+    made_dirs: set[str] = set()
     for path in input_paths:
         out_path = args.out if args.out else _default_out_path(path, args.out_dir)
 
@@ -163,7 +166,10 @@ def main(argv: list[str]) -> int:
         )
 
         try:
-            os.makedirs(os.path.dirname(out_path) or ".", exist_ok=True)
+            out_parent = os.path.dirname(out_path) or "."
+            if out_parent not in made_dirs:
+                os.makedirs(out_parent, exist_ok=True)
+                made_dirs.add(out_parent)
             with open(out_path, "wb") as f:
                 f.write(data)
         except OSError as e:
@@ -3,11 +3,16 @@
 from __future__ import annotations
 
 import argparse
+import functools
+import itertools
 import math
+import operator
+import os
 import re
+import struct
 import sys
-from collections import defaultdict
-from typing import Iterable, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterable, Optional, Tuple
 
 try:
     import openmeta
@@ -21,43 +26,78 @@ except ModuleNotFoundError:
     raise SystemExit(2)
 
 
+# Zero-width match before each non-leading capital; the literal "_"
+# replacement avoids the backreference template path.
+_SNAKE_RE = re.compile(r"(?<!^)(?=[A-Z])")
+
+
+@functools.lru_cache(maxsize=1024)
 def _snake(name: str) -> str:
-    return re.sub(r"(?<!^)([A-Z])", r"_\1", name).lower()
+    return _SNAKE_RE.sub("_", name).lower()
+
+
+_TIFF_TYPE_NAME_BY_CODE: dict[int, str] = {
+    1: "BYTE",
+    2: "ASCII",
+    3: "SHORT",
+    4: "LONG",
+    5: "RATIONAL",
+    6: "SBYTE",
+    7: "UNDEFINED",
+    8: "SSHORT",
+    9: "SLONG",
+    10: "SRATIONAL",
+    11: "FLOAT",
+    12: "DOUBLE",
+    13: "IFD",
+    16: "LONG8",
+    17: "SLONG8",
+    18: "IFD8",
+    129: "UTF8",
+}
+
+# Indexed by type code; the highest known code is 129 (UTF8).
+_TIFF_TYPE_NAMES: Tuple[str, ...] = tuple(
+    _TIFF_TYPE_NAME_BY_CODE.get(code, "UNKNOWN") for code in range(max(_TIFF_TYPE_NAME_BY_CODE) + 1)
+)
 
 
 def _tiff_type_name(code: int) -> str:
-    return {
-        1: "BYTE",
-        2: "ASCII",
-        3: "SHORT",
-        4: "LONG",
-        5: "RATIONAL",
-        6: "SBYTE",
-        7: "UNDEFINED",
-        8: "SSHORT",
-        9: "SLONG",
-        10: "SRATIONAL",
-        11: "FLOAT",
-        12: "DOUBLE",
-        13: "IFD",
-        16: "LONG8",
-        17: "SLONG8",
-        18: "IFD8",
-        129: "UTF8",
-    }.get(code, "UNKNOWN")
+    return _TIFF_TYPE_NAMES[code] if 0 <= code < len(_TIFF_TYPE_NAMES) else "UNKNOWN"
+
+
+@functools.lru_cache(maxsize=None)
+def _tag_type_cell(code: int) -> str:
+    return _truncate_cell(f"{code}({_tiff_type_name(code)})", 12)
 
 
 def _fmt_float(x: float) -> str:
-    if math.isnan(x):
-        return "nan"
-    if math.isinf(x):
+    if not math.isfinite(x):
+        if math.isnan(x):
+            return "nan"
         return "inf" if x > 0 else "-inf"
+    if x.is_integer() and x != 0.0:
+        # Same digits as the fixed-point path below, without the strip passes.
+        return str(int(x))
     return f"{x:.6f}".rstrip("0").rstrip(".")
 
 
+# Denominators whose quotients can be formatted exactly with integer math.
+_DECIMAL_DENOM_DIGITS: dict[int, int] = {10: 1, 100: 2, 1000: 3, 10000: 4}
+
+
 def _rational_to_decimal(n: int, d: int) -> str:
     if d == 0:
         return "inf"
+    if d == 1:
+        return str(n)
+    digits = _DECIMAL_DENOM_DIGITS.get(d)
+    if digits is not None:
+        q, r = divmod(abs(n), d)
+        sign = "-" if n < 0 else ""
+        if r == 0:
+            return f"{sign}{q}"
+        return f"{sign}{q}.{r:0{digits}d}".rstrip("0")
     try:
         return _fmt_float(float(n) / float(d))
     except Exception:
@@ -65,42 +105,49 @@ def _rational_to_decimal(n: int, d: int) -> str:
 
 
 def _truncate_cell(s: str, max_chars: int) -> str:
-    if max_chars != 0 and len(s) > max_chars:
-        return s[: max(0, max_chars - 3)] + "..."
-    return s
+    if max_chars == 0 or len(s) <= max_chars:
+        return s
+    return s[: max(0, max_chars - 3)] + "..."
 
 
 def _corrupted_text_placeholder(escaped: str) -> str:
     return f"<CORRUPTED_TEXT:unsafe_console_text:{escaped}>"
 
 
+_BE_U32 = struct.Struct(">I").pack
+_FOURCC_RE = re.compile(rb"[\x20-\x7E]{4}")
+
+
 def _fourcc_str(v: int) -> str:
-    b = bytes([(v >> 24) & 0xFF, (v >> 16) & 0xFF, (v >> 8) & 0xFF, v & 0xFF])
-    if all(0x20 <= c <= 0x7E for c in b):
-        return b.decode("ascii", errors="replace")
+    b = _BE_U32(v & 0xFFFFFFFF)
+    if _FOURCC_RE.fullmatch(b) is not None:
+        return b.decode("ascii")
     return f"0x{v:08X}"
 
 
+_ICC_HEADER_FIELD_NAMES: dict[int, str] = {
+    0: "profile_size",
+    4: "cmm_type",
+    8: "version",
+    12: "class",
+    16: "data_space",
+    20: "pcs",
+    24: "date_time",
+    36: "signature",
+    40: "platform",
+    44: "flags",
+    48: "manufacturer",
+    52: "model",
+    56: "attributes",
+    64: "rendering_intent",
+    68: "pcs_illuminant",
+    80: "creator",
+    84: "profile_id",
+}
+
+
 def _icc_header_field_name(offset: int) -> str:
-    return {
-        0: "profile_size",
-        4: "cmm_type",
-        8: "version",
-        12: "class",
-        16: "data_space",
-        20: "pcs",
-        24: "date_time",
-        36: "signature",
-        40: "platform",
-        44: "flags",
-        48: "manufacturer",
-        52: "model",
-        56: "attributes",
-        64: "rendering_intent",
-        68: "pcs_illuminant",
-        80: "creator",
-        84: "profile_id",
-    }.get(offset, "-")
+    return _ICC_HEADER_FIELD_NAMES.get(offset, "-")
 
 
 def _icc_header_is_fourcc(offset: int) -> bool:
@@ -117,122 +164,548 @@ def _icc_header_is_fourcc(offset: int) -> bool:
     }
 
 
+_PHOTOSHOP_RESOURCE_NAMES: dict[int, str] = {
+    0x0404: "IPTC_NAA",
+    0x0422: "EXIF_DATA_1",
+    0x0423: "EXIF_DATA_3",
+}
+
+
 def _photoshop_resource_name(rid: int) -> str:
-    return {
-        0x0404: "IPTC_NAA",
-        0x0422: "EXIF_DATA_1",
-        0x0423: "EXIF_DATA_3",
-    }.get(rid, "-")
+    return _PHOTOSHOP_RESOURCE_NAMES.get(rid, "-")
+
+
+_ASCII_RE = re.compile(rb"[\x09-\x0D\x20-\x7E]+")
 
 
 def _looks_ascii(data: bytes) -> bool:
-    if not data:
-        return False
-    if b"\x00" in data:
-        return False
-    for c in data:
-        if c < 0x09 or (0x0D < c < 0x20) or c > 0x7E:
-            return False
-    return True
-
-
-def _val_type(e: openmeta.Entry) -> str:
-    k = e.value_kind
-    if k == openmeta.MetaValueKind.Empty:
+    return _ASCII_RE.fullmatch(data) is not None
+
+
+def _val_type(
+    k: openmeta.MetaValueKind,
+    t: openmeta.MetaElementType,
+    count: int,
+    *,
+    _empty: openmeta.MetaValueKind = openmeta.MetaValueKind.Empty,
+    _scalar: openmeta.MetaValueKind = openmeta.MetaValueKind.Scalar,
+    _array: openmeta.MetaValueKind = openmeta.MetaValueKind.Array,
+    _text: openmeta.MetaValueKind = openmeta.MetaValueKind.Text,
+    _bytes: openmeta.MetaValueKind = openmeta.MetaValueKind.Bytes,
+    _rational_types: tuple = (openmeta.MetaElementType.URational, openmeta.MetaElementType.SRational),
+    _float_types: tuple = (openmeta.MetaElementType.F32, openmeta.MetaElementType.F64),
+) -> str:
+    # Enum members are bound as defaults: this runs once per printed row.
+    if k == _empty:
         return "-"
-    if k == openmeta.MetaValueKind.Scalar:
-        t = e.elem_type
-        if t in (openmeta.MetaElementType.URational, openmeta.MetaElementType.SRational):
+    if k == _scalar:
+        if t in _rational_types:
             return t.name.lower()
-        if t in (openmeta.MetaElementType.F32, openmeta.MetaElementType.F64):
+        if t in _float_types:
             return "f"
         if t.name.startswith("U"):
             return "u"
         if t.name.startswith("I"):
             return "i"
         return t.name.lower()
-    if k == openmeta.MetaValueKind.Array:
-        return f"array[{e.count}]"
-    if k == openmeta.MetaValueKind.Text:
-        return f"text[{e.count}]"
-    if k == openmeta.MetaValueKind.Bytes:
-        return f"bytes[{e.count}]"
+    if k == _array:
+        return f"array[{count}]"
+    if k == _text:
+        return f"text[{count}]"
+    if k == _bytes:
+        return f"bytes[{count}]"
     return k.name.lower()
 
 
-def _format_value(e: openmeta.Entry, *, max_elements: int, max_bytes: int) -> Tuple[str, str]:
-    v = e.value(max_elements=max_elements, max_bytes=max_bytes)
+def _hex_form(v: bytes, max_bytes: int, byte_forms: Optional[Tuple[Optional[str], Optional[str], bool]]) -> str:
+    if byte_forms is not None and byte_forms[0] is not None:
+        return byte_forms[0]
+    return openmeta.hex_bytes(v, max_bytes=int(max_bytes))
 
-    if v is None:
-        return "-", "-"
 
-    if isinstance(v, bytes):
-        if e.key_kind == openmeta.MetaKeyKind.IptcDataset and _looks_ascii(v):
-            raw_hex = openmeta.hex_bytes(v, max_bytes=int(max_bytes))
-            text, dangerous = openmeta.console_text(v, max_bytes=int(max_bytes))
-            val = text if not dangerous else _corrupted_text_placeholder(text)
-            return raw_hex, val
-
-        if e.key_kind == openmeta.MetaKeyKind.IccHeaderField and len(v) == 4 and _looks_ascii(v):
-            raw_hex = openmeta.hex_bytes(v, max_bytes=int(max_bytes))
-            return raw_hex, v.decode("ascii", errors="replace")
-
-        if e.value_kind == openmeta.MetaValueKind.Text:
-            raw, dangerous = openmeta.console_text(v, max_bytes=int(max_bytes))
-            val = raw if not dangerous else _corrupted_text_placeholder(raw)
-            return raw, val
-
-        if e.key_kind == openmeta.MetaKeyKind.IccTag:
-            raw = openmeta.hex_bytes(v, max_bytes=int(max_bytes))
-            try:
-                rendered = openmeta.icc_render_value(
-                    int(e.icc_tag_signature),
-                    v,
-                    max_values=int(max_elements),
-                    max_text_bytes=int(max_bytes),
-                )
-                if isinstance(rendered, str) and rendered:
-                    return raw, rendered
-            except Exception:
-                pass
-            return raw, raw
+def _text_form(
+    v: bytes, max_bytes: int, byte_forms: Optional[Tuple[Optional[str], Optional[str], bool]]
+) -> Tuple[str, bool]:
+    if byte_forms is not None and byte_forms[1] is not None:
+        return byte_forms[1], byte_forms[2]
+    return openmeta.console_text(v, max_bytes=int(max_bytes))
 
-        raw = openmeta.hex_bytes(v, max_bytes=int(max_bytes))
-        return raw, raw
 
-    if isinstance(v, tuple) and len(v) == 2 and all(isinstance(x, int) for x in v):
+def _icc_render(sig: int, v: bytes, max_elements: int, max_bytes: int) -> Optional[str]:
+    try:
+        rendered = openmeta.icc_render_value(
+            sig,
+            v,
+            max_values=int(max_elements),
+            max_text_bytes=int(max_bytes),
+        )
+    except Exception:
+        return None
+    return rendered if isinstance(rendered, str) and rendered else None
+
+
+# ICC tag renders are the one byte-payload format worth memoizing: the same
+# profiles (and their desc/XYZ/curve tags) recur across a batch.
+_ICC_RENDER_CACHE_MAX_BYTES = 1024
+_icc_render_cached = functools.lru_cache(maxsize=256)(_icc_render)
+
+
+def _fmt_bytes(
+    key_kind: openmeta.MetaKeyKind,
+    value_kind: openmeta.MetaValueKind,
+    key_extra: int,
+    v: bytes,
+    max_elements: int,
+    max_bytes: int,
+    byte_forms: Optional[Tuple[Optional[str], Optional[str], bool]],
+) -> Tuple[str, str]:
+    # byte_forms is (hex, console_text, dangerous) from openmeta.format_all_bytes;
+    # forms it skipped are None and computed on demand.
+    if key_kind == openmeta.MetaKeyKind.IptcDataset and _looks_ascii(v):
+        text, dangerous = _text_form(v, max_bytes, byte_forms)
+        val = text if not dangerous else _corrupted_text_placeholder(text)
+        return _hex_form(v, max_bytes, byte_forms), val
+
+    if key_kind == openmeta.MetaKeyKind.IccHeaderField and len(v) == 4 and _looks_ascii(v):
+        return _hex_form(v, max_bytes, byte_forms), v.decode("ascii", errors="replace")
+
+    if value_kind == openmeta.MetaValueKind.Text:
+        text, dangerous = _text_form(v, max_bytes, byte_forms)
+        val = text if not dangerous else _corrupted_text_placeholder(text)
+        return text, val
+
+    raw_hex = _hex_form(v, max_bytes, byte_forms)
+    if key_kind == openmeta.MetaKeyKind.IccTag:
+        if len(v) <= _ICC_RENDER_CACHE_MAX_BYTES:
+            rendered = _icc_render_cached(key_extra, v, max_elements, max_bytes)
+        else:
+            rendered = _icc_render(key_extra, v, max_elements, max_bytes)
+        if rendered:
+            return raw_hex, rendered
+
+    return raw_hex, raw_hex
+
+
+def _fmt_tuple(
+    key_kind: openmeta.MetaKeyKind,
+    value_kind: openmeta.MetaValueKind,
+    key_extra: int,
+    v: tuple,
+    max_elements: int,
+    max_bytes: int,
+    byte_forms: Optional[Tuple[Optional[str], Optional[str], bool]],
+) -> Tuple[str, str]:
+    if len(v) == 2 and all(isinstance(x, int) for x in v):
         raw = f"{v[0]}/{v[1]}"
         val = _rational_to_decimal(v[0], v[1])
         return raw, val
+    return str(v), str(v)
 
-    if isinstance(v, list):
-        if v and isinstance(v[0], tuple) and len(v[0]) == 2:
-            raw_parts = []
-            val_parts = []
-            for item in v:
-                if not (isinstance(item, tuple) and len(item) == 2):
-                    break
-                n, d = item
-                raw_parts.append(f"{n}/{d}")
-                val_parts.append(_rational_to_decimal(int(n), int(d)))
-            return ", ".join(raw_parts), ", ".join(val_parts)
-        return ", ".join(str(x) for x in v), ", ".join(str(x) for x in v)
+
+def _fmt_list(
+    key_kind: openmeta.MetaKeyKind,
+    value_kind: openmeta.MetaValueKind,
+    key_extra: int,
+    v: list,
+    max_elements: int,
+    max_bytes: int,
+    byte_forms: Optional[Tuple[Optional[str], Optional[str], bool]],
+) -> Tuple[str, str]:
+    if v and isinstance(v[0], tuple) and len(v[0]) == 2:
+        # Rational elements come from the binding as (int, int) tuples.
+        raw_parts = []
+        val_parts = []
+        add_raw = raw_parts.append
+        add_val = val_parts.append
+        for item in v:
+            if type(item) is not tuple or len(item) != 2:
+                break
+            n, d = item
+            add_raw(f"{n}/{d}")
+            add_val(_rational_to_decimal(n, d))
+        return ", ".join(raw_parts), ", ".join(val_parts)
+    return ", ".join(str(x) for x in v), ", ".join(str(x) for x in v)
+
+
+_FMT_DISPATCH: dict[type, Callable[..., Tuple[str, str]]] = {
+    bytes: _fmt_bytes,
+    tuple: _fmt_tuple,
+    list: _fmt_list,
+}
+
+
+def _format_value_uncached(
+    key_kind: openmeta.MetaKeyKind,
+    value_kind: openmeta.MetaValueKind,
+    key_extra: int,
+    v: object,
+    max_elements: int,
+    max_bytes: int,
+    byte_forms: Optional[Tuple[Optional[str], Optional[str], bool]],
+) -> Tuple[str, str]:
+    fn = _FMT_DISPATCH.get(type(v))
+    if fn is not None:
+        return fn(key_kind, value_kind, key_extra, v, max_elements, max_bytes, byte_forms)
 
     if (
         isinstance(v, int)
-        and e.key_kind == openmeta.MetaKeyKind.IccHeaderField
-        and _icc_header_is_fourcc(int(e.icc_header_offset))
+        and key_kind == openmeta.MetaKeyKind.IccHeaderField
+        and _icc_header_is_fourcc(key_extra)
     ):
         return str(v), _fourcc_str(int(v))
 
     return str(v), str(v)
 
 
-def _iter_exif_entries(doc: openmeta.Document) -> Iterable[openmeta.Entry]:
-    for i in range(int(doc.entry_count)):
-        e = doc[i]
-        if e.key_kind == openmeta.MetaKeyKind.ExifTag:
-            yield e
+# Only scalars and short arrays are memoized; larger ones would just pin
+# memory. Byte payloads use the forms from openmeta.format_all_bytes instead.
+_FORMAT_CACHE_MAX_ELEMENTS = 16
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_value_cached(
+    key_kind: openmeta.MetaKeyKind,
+    value_kind: openmeta.MetaValueKind,
+    key_extra: int,
+    is_list: bool,
+    v: object,
+    max_elements: int,
+    max_bytes: int,
+) -> Tuple[str, str]:
+    if is_list:
+        v = list(v)
+    return _format_value_uncached(key_kind, value_kind, key_extra, v, max_elements, max_bytes, None)
+
+
+def _format_value(
+    e: openmeta.Entry,
+    snap: openmeta.EntrySnapshot,
+    *,
+    max_elements: int,
+    max_bytes: int,
+    byte_forms: Optional[Tuple[Optional[str], Optional[str], bool]] = None,
+) -> Tuple[str, str]:
+    v = e.value(max_elements=max_elements, max_bytes=max_bytes)
+
+    if v is None:
+        return "-", "-"
+
+    key_kind = snap.key_kind
+    if key_kind == openmeta.MetaKeyKind.IccTag:
+        key_extra = int(e.icc_tag_signature)
+    elif key_kind == openmeta.MetaKeyKind.IccHeaderField:
+        key_extra = int(e.icc_header_offset)
+    else:
+        key_extra = 0
+    value_kind = snap.value_kind
+
+    # Floats bypass the cache: 0.0 and -0.0 compare equal but print differently,
+    # and 1.0 would share a key with 1.
+    if snap.elem_type in (openmeta.MetaElementType.F32, openmeta.MetaElementType.F64):
+        return _format_value_uncached(key_kind, value_kind, key_extra, v, max_elements, max_bytes, byte_forms)
+    if isinstance(v, bytes):
+        return _format_value_uncached(key_kind, value_kind, key_extra, v, max_elements, max_bytes, byte_forms)
+    if isinstance(v, (list, tuple)) and len(v) > _FORMAT_CACHE_MAX_ELEMENTS:
+        return _format_value_uncached(key_kind, value_kind, key_extra, v, max_elements, max_bytes, byte_forms)
+
+    is_list = isinstance(v, list)
+    return _format_value_cached(
+        key_kind,
+        value_kind,
+        key_extra,
+        is_list,
+        tuple(v) if is_list else v,
+        max_elements,
+        max_bytes,
+    )
+
+
+_EXIF_ROW = "%4d | %-6s | %-18s | 0x%04X | %-12s | %5d | %-10s | %-30s | %s\n"
+_XMP_ROW = "%4d | %-22s | %-22s | %-10s | %-30s | %s\n"
+_GENERIC_ROW = "%4d | %-12s | %-14s | %-10s | %-30s | %s\n"
+
+
+def _dump_file(
+    path: str,
+    args: argparse.Namespace,
+    write: Callable[[str], object],
+    next_path: Optional[str] = None,
+) -> None:
+    # Key kinds compared in the per-entry loops.
+    kind_exif = openmeta.MetaKeyKind.ExifTag
+    kind_xmp = openmeta.MetaKeyKind.XmpProperty
+    kind_iptc = openmeta.MetaKeyKind.IptcDataset
+    kind_irb = openmeta.MetaKeyKind.PhotoshopIrb
+    kind_icc_header = openmeta.MetaKeyKind.IccHeaderField
+    kind_icc_tag = openmeta.MetaKeyKind.IccTag
+    kind_exr = openmeta.MetaKeyKind.ExrAttribute
+
+    # --max-cell-chars limit and the slice length kept before "...".
+    mcc = args.max_cell_chars
+    mcc_cut = max(0, mcc - 3)
+
+    # Every array element renders as at least one char plus ", ", so a cell
+    # is already full after mcc // 2 + 2 elements; fetch no more than that.
+    max_elements = args.max_elements
+    if mcc > 0:
+        cell_elements = mcc // 2 + 2
+        if max_elements == 0 or max_elements > cell_elements:
+            max_elements = cell_elements
+
+    doc = openmeta.read(
+        path,
+        include_pointer_tags=not args.no_pointer_tags,
+        decode_makernote=bool(args.makernotes),
+        decompress=not args.no_decompress,
+        include_xmp_sidecar=bool(args.xmp_sidecar),
+        max_file_bytes=int(args.max_file_bytes),
+    )
+    if next_path is not None:
+        _prefetch(next_path, int(args.max_file_bytes))
+
+    write(f"== {path}\n")
+    write(f"size={doc.file_size}\n")
+    write(f"scan={_snake(doc.scan_status.name)} written={doc.scan_written} needed={doc.scan_needed}\n")
+
+    if not args.no_blocks:
+        for i, b in enumerate(doc.blocks):
+            write(
+                "block[{i}] format={fmt} kind={kind} comp={comp} chunking={chunk} "
+                "id=0x{id:08X} outer=({oo},{os}) data=({do},{ds})\n".format(
+                    i=i,
+                    fmt=_snake(b.format.name),
+                    kind=_snake(b.kind.name),
+                    comp=_snake(b.compression.name),
+                    chunk=_snake(b.chunking.name),
+                    id=int(b.id),
+                    oo=int(b.outer_offset),
+                    os=int(b.outer_size),
+                    do=int(b.data_offset),
+                    ds=int(b.data_size),
+                )
+            )
+
+    write(
+        f"exif={_snake(doc.exif_status.name)} ifds_decoded={doc.exif_ifds_decoded} "
+        f"exr={_snake(doc.exr_status.name)} exr_parts={doc.exr_parts_decoded} exr_entries={doc.exr_entries_decoded} "
+        f"xmp={_snake(doc.xmp_status.name)} xmp_entries={doc.xmp_entries_decoded} "
+        f"entries={doc.entry_count} blocks={doc.block_count}\n"
+    )
+    if (
+        doc.exif_status == openmeta.ExifDecodeStatus.LimitExceeded
+        and doc.exif_limit_reason != openmeta.ExifLimitReason.None_
+    ):
+        write(
+            "exif_limit "
+            f"reason={_snake(doc.exif_limit_reason.name)} "
+            f"ifd_off={int(doc.exif_limit_ifd_offset)} "
+            f"tag=0x{int(doc.exif_limit_tag):04X}\n"
+        )
+
+    # EXIF tag name -> truncated name cell; names repeat across IFDs.
+    name_cells: dict[str, str] = {}
+
+    # Order entries by (block, order) using the bulk columns, so no Entry
+    # properties are read. The store does not guarantee this order (e.g.
+    # JPEG APP segments interleave), but it often already holds; then the
+    # sort is skipped. Keys are packed (block << 32) | order ints, and the
+    # stable sort keeps entry-index order for ties.
+    all_entries = doc.entries()
+    cols = doc.entries_bulk(names=False)
+    col_ifd = cols["ifd"]
+    col_key_kind = cols["key_kind"]
+    col_block = cols["origin_block"]
+    packed = [(block << 32) | order for block, order in zip(col_block, cols["origin_order"])]
+    if all(packed[i] <= packed[i + 1] for i in range(len(packed) - 1)):
+        ordered: Iterable[int] = range(len(packed))
+    else:
+        ordered = sorted(range(len(packed)), key=packed.__getitem__)
+
+    for block_id, block_group in itertools.groupby(ordered, key=col_block.__getitem__):
+        indices = list(block_group)
+
+        if indices and col_key_kind[indices[0]] == kind_exif:
+            # Group by IFD token inside the EXIF block.
+            by_ifd = sorted((col_ifd[i] or "", pos, i) for pos, i in enumerate(indices))
+
+            for ifd, ifd_group in itertools.groupby(by_ifd, key=operator.itemgetter(0)):
+                ifd_entries = [all_entries[item[2]] for item in ifd_group]
+                width = 119
+                write("=" * width + "\n")
+                write(f" ifd={ifd} block={block_id} entries={len(ifd_entries)}\n")
+                write("=" * width + "\n")
+                write(
+                    " idx | ifd    | name               | tag    | tag type     | count | type       | raw val                        | val\n"
+                )
+                write("-" * width + "\n")
+
+                ifd_short = (ifd or "-")[:6]
+                byte_forms = openmeta.format_all_bytes(ifd_entries, args.max_bytes)
+                rows: list[str] = []
+                row = rows.append
+                for idx, e in enumerate(ifd_entries):
+                    # One binding call for the fields this row reads.
+                    snap = e.snapshot()
+                    tag = snap.tag if snap.tag is not None else 0
+                    name = snap.name if snap.name is not None else "-"
+
+                    raw, val = _format_value(
+                        e,
+                        snap,
+                        max_elements=max_elements,
+                        max_bytes=args.max_bytes,
+                        byte_forms=byte_forms[idx],
+                    )
+                    # Inlined _truncate_cell for the two unbounded cells.
+                    if mcc and len(raw) > mcc:
+                        raw = raw[:mcc_cut] + "..."
+                    if mcc and len(val) > mcc:
+                        val = val[:mcc_cut] + "..."
+
+                    name_cell = name_cells.get(name)
+                    if name_cell is None:
+                        name_cell = name_cells[name] = _truncate_cell(name, 18)
+                    tag_type_cell = _tag_type_cell(snap.wire_type_code)
+                    val_type_cell = _truncate_cell(_val_type(snap.value_kind, snap.elem_type, snap.count), 10)
+                    row(
+                        _EXIF_ROW
+                        % (
+                            idx,
+                            ifd_short,
+                            name_cell,
+                            tag,
+                            tag_type_cell,
+                            snap.wire_count,
+                            val_type_cell,
+                            raw,
+                            val,
+                        )
+                    )
+                # One write per IFD table rather than one per row.
+                write("".join(rows))
+                write("=" * width + "\n")
+            continue
+
+        entries = [all_entries[i] for i in indices]
+        if entries and col_key_kind[indices[0]] == kind_xmp:
+            width = 120
+            write("=" * width + "\n")
+            write(f" xmp block={block_id} entries={len(entries)}\n")
+            write("=" * width + "\n")
+            write(" idx | schema                 | path                   | type       | raw val                        | val\n")
+            write("-" * width + "\n")
+
+            byte_forms = openmeta.format_all_bytes(entries, args.max_bytes)
+            rows = []
+            row = rows.append
+            for idx, e in enumerate(entries):
+                schema = str(e.xmp_schema_ns or "-")
+                path_s = str(e.xmp_path or "-")
+                snap = e.snapshot()
+
+                raw, val = _format_value(
+                    e,
+                    snap,
+                    max_elements=max_elements,
+                    max_bytes=args.max_bytes,
+                    byte_forms=byte_forms[idx],
+                )
+                if mcc and len(raw) > mcc:
+                    raw = raw[:mcc_cut] + "..."
+                if mcc and len(val) > mcc:
+                    val = val[:mcc_cut] + "..."
+
+                schema_cell = _truncate_cell(schema, 22)
+                path_cell = _truncate_cell(path_s, 22)
+                val_type_cell = _truncate_cell(_val_type(snap.value_kind, snap.elem_type, snap.count), 10)
+                row(_XMP_ROW % (idx, schema_cell, path_cell, val_type_cell, raw, val))
+            write("".join(rows))
+            write("=" * width + "\n")
+            continue
+
+        # Generic non-EXIF block table.
+        width = 100
+        write("=" * width + "\n")
+        if entries:
+            write(f" kind={_snake(col_key_kind[indices[0]].name)} block={block_id} entries={len(entries)}\n")
+        else:
+            write(f" block={block_id} entries=0\n")
+        write("=" * width + "\n")
+        write(" idx | key            | name            | type       | raw val                        | val\n")
+        write("-" * width + "\n")
+
+        byte_forms = openmeta.format_all_bytes(entries, args.max_bytes)
+        rows = []
+        row = rows.append
+        for idx, e in enumerate(entries):
+            key = "-"
+            name = "-"
+            snap = e.snapshot()
+            key_kind = snap.key_kind
+            if key_kind == kind_iptc:
+                key = f"{int(e.iptc_record)}:{int(e.iptc_dataset)}"
+            elif key_kind == kind_irb:
+                key = f"0x{int(e.photoshop_resource_id):04X}"
+                name = _photoshop_resource_name(int(e.photoshop_resource_id))
+            elif key_kind == kind_icc_header:
+                key = f"0x{int(e.icc_header_offset):X}"
+                name = _icc_header_field_name(int(e.icc_header_offset))
+            elif key_kind == kind_icc_tag:
+                key = _fourcc_str(int(e.icc_tag_signature))
+                name = str(snap.name or "-")
+            elif key_kind == kind_exr:
+                key = f"part:{int(e.exr_part)}"
+                name = str(e.exr_name or "-")
+
+            raw, val = _format_value(
+                e,
+                snap,
+                max_elements=max_elements,
+                max_bytes=args.max_bytes,
+                byte_forms=byte_forms[idx],
+            )
+            if mcc and len(raw) > mcc:
+                raw = raw[:mcc_cut] + "..."
+            if mcc and len(val) > mcc:
+                val = val[:mcc_cut] + "..."
+
+            key_cell = _truncate_cell(key, 12)
+            name_cell = _truncate_cell(name, 14)
+            val_type_cell = _truncate_cell(_val_type(snap.value_kind, snap.elem_type, snap.count), 10)
+            row(_GENERIC_ROW % (idx, key_cell, name_cell, val_type_cell, raw, val))
+        write("".join(rows))
+        write("=" * width + "\n")
+
+
+def _format_file(path: str, args: argparse.Namespace) -> str:
+    # --jobs worker: the whole report for one file as a single string.
+    out: list[str] = []
+    _dump_file(path, args, out.append)
+    return "".join(out)
+
+
+# openmeta.read maps the file but only touches the metadata, which sits near
+# the start for the common formats; advising more would pull whole RAW or
+# video files into the page cache.
+_PREFETCH_BYTES = 1 << 20
+
+
+def _prefetch(path: str, max_file_bytes: int) -> None:
+    # Best effort: called once the current input has been read, so the
+    # readahead for the next one overlaps formatting instead of the read.
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        length = _PREFETCH_BYTES if max_file_bytes <= 0 else min(_PREFETCH_BYTES, max_file_bytes)
+        os.posix_fadvise(fd, 0, length, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
 
 
 def main(argv: list[str]) -> int:
@@ -253,172 +726,36 @@ def main(argv: list[str]) -> int:
         default=0,
         help="optional file mapping cap in bytes (0=unlimited)",
     )
+    ap.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="worker processes for multiple files (0=min(8, cpu count)); output stays in input order",
+    )
     args = ap.parse_args(argv)
+    if args.jobs < 0:
+        ap.error("--jobs must be >= 0")
+    write = sys.stdout.write
 
     if not args.no_build_info:
         l1, l2 = openmeta.info_lines()
-        print(l1)
-        print(l2)
-        print(openmeta.python_info_line())
-
-    for path in args.files:
-        doc = openmeta.read(
-            path,
-            include_pointer_tags=not args.no_pointer_tags,
-            decode_makernote=bool(args.makernotes),
-            decompress=not args.no_decompress,
-            include_xmp_sidecar=bool(args.xmp_sidecar),
-            max_file_bytes=int(args.max_file_bytes),
-        )
-
-        print(f"== {path}")
-        print(f"size={doc.file_size}")
-        print(f"scan={_snake(doc.scan_status.name)} written={doc.scan_written} needed={doc.scan_needed}")
-
-        if not args.no_blocks:
-            for i, b in enumerate(doc.blocks):
-                print(
-                    "block[{i}] format={fmt} kind={kind} comp={comp} chunking={chunk} "
-                    "id=0x{id:08X} outer=({oo},{os}) data=({do},{ds})".format(
-                        i=i,
-                        fmt=_snake(b.format.name),
-                        kind=_snake(b.kind.name),
-                        comp=_snake(b.compression.name),
-                        chunk=_snake(b.chunking.name),
-                        id=int(b.id),
-                        oo=int(b.outer_offset),
-                        os=int(b.outer_size),
-                        do=int(b.data_offset),
-                        ds=int(b.data_size),
-                    )
-                )
-
-        print(
-            f"exif={_snake(doc.exif_status.name)} ifds_decoded={doc.exif_ifds_decoded} "
-            f"exr={_snake(doc.exr_status.name)} exr_parts={doc.exr_parts_decoded} exr_entries={doc.exr_entries_decoded} "
-            f"xmp={_snake(doc.xmp_status.name)} xmp_entries={doc.xmp_entries_decoded} "
-            f"entries={doc.entry_count} blocks={doc.block_count}"
-        )
-        if (
-            doc.exif_status == openmeta.ExifDecodeStatus.LimitExceeded
-            and doc.exif_limit_reason != openmeta.ExifLimitReason.None_
-        ):
-            print(
-                "exif_limit "
-                f"reason={_snake(doc.exif_limit_reason.name)} "
-                f"ifd_off={int(doc.exif_limit_ifd_offset)} "
-                f"tag=0x{int(doc.exif_limit_tag):04X}"
-            )
-
-        by_block: dict[int, list[openmeta.Entry]] = defaultdict(list)
-        for i in range(int(doc.entry_count)):
-            e = doc[i]
-            by_block[int(e.origin_block)].append(e)
-
-        for block_id in sorted(by_block.keys()):
-            entries = by_block[block_id]
-            entries.sort(key=lambda x: int(x.origin_order))
-
-            if entries and entries[0].key_kind == openmeta.MetaKeyKind.ExifTag:
-                # Group by IFD token inside the EXIF block.
-                by_ifd: dict[str, list[openmeta.Entry]] = defaultdict(list)
-                for e in entries:
-                    by_ifd[str(e.ifd or "")].append(e)
-
-                for ifd, ifd_entries in sorted(by_ifd.items()):
-                    width = 119
-                    print("=" * width)
-                    print(f" ifd={ifd} block={block_id} entries={len(ifd_entries)}")
-                    print("=" * width)
-                    print(
-                        " idx | ifd    | name               | tag    | tag type     | count | type       | raw val                        | val"
-                    )
-                    print("-" * width)
-
-                    for idx, e in enumerate(ifd_entries):
-                        tag = e.tag if e.tag is not None else 0
-                        name = e.name if e.name is not None else "-"
-                        ifd_short = (e.ifd or "-")[:6]
-
-                        type_code = int(e.wire_type_code)
-                        type_name = _tiff_type_name(type_code)
-                        tag_type = f"{type_code}({type_name})"
-
-                        raw, val = _format_value(e, max_elements=args.max_elements, max_bytes=args.max_bytes)
-                        raw = _truncate_cell(raw, args.max_cell_chars)
-                        val = _truncate_cell(val, args.max_cell_chars)
-
-                        print(
-                            f"{idx:4d} | {ifd_short:<6} | {_truncate_cell(str(name), 18):<18} | "
-                            f"0x{int(tag):04X} | {_truncate_cell(tag_type, 12):<12} | "
-                            f"{int(e.wire_count):5d} | {_truncate_cell(_val_type(e), 10):<10} | "
-                            f"{raw:<30} | {val}"
-                        )
-                    print("=" * width)
-                continue
-
-            if entries and entries[0].key_kind == openmeta.MetaKeyKind.XmpProperty:
-                width = 120
-                print("=" * width)
-                print(f" xmp block={block_id} entries={len(entries)}")
-                print("=" * width)
-                print(" idx | schema                 | path                   | type       | raw val                        | val")
-                print("-" * width)
-
-                for idx, e in enumerate(entries):
-                    schema = str(e.xmp_schema_ns or "-")
-                    path_s = str(e.xmp_path or "-")
-
-                    raw, val = _format_value(e, max_elements=args.max_elements, max_bytes=args.max_bytes)
-                    raw = _truncate_cell(raw, args.max_cell_chars)
-                    val = _truncate_cell(val, args.max_cell_chars)
-
-                    print(
-                        f"{idx:4d} | {_truncate_cell(schema, 22):<22} | {_truncate_cell(path_s, 22):<22} | "
-                        f"{_truncate_cell(_val_type(e), 10):<10} | {raw:<30} | {val}"
-                    )
-                print("=" * width)
-                continue
-
-            # Generic non-EXIF block table.
-            width = 100
-            print("=" * width)
-            if entries:
-                print(f" kind={_snake(entries[0].key_kind.name)} block={block_id} entries={len(entries)}")
-            else:
-                print(f" block={block_id} entries=0")
-            print("=" * width)
-            print(" idx | key            | name            | type       | raw val                        | val")
-            print("-" * width)
-
-            for idx, e in enumerate(entries):
-                key = "-"
-                name = "-"
-                if e.key_kind == openmeta.MetaKeyKind.IptcDataset:
-                    key = f"{int(e.iptc_record)}:{int(e.iptc_dataset)}"
-                elif e.key_kind == openmeta.MetaKeyKind.PhotoshopIrb:
-                    key = f"0x{int(e.photoshop_resource_id):04X}"
-                    name = _photoshop_resource_name(int(e.photoshop_resource_id))
-                elif e.key_kind == openmeta.MetaKeyKind.IccHeaderField:
-                    key = f"0x{int(e.icc_header_offset):X}"
-                    name = _icc_header_field_name(int(e.icc_header_offset))
-                elif e.key_kind == openmeta.MetaKeyKind.IccTag:
-                    key = _fourcc_str(int(e.icc_tag_signature))
-                    name = str(e.name or "-")
-                elif e.key_kind == openmeta.MetaKeyKind.ExrAttribute:
-                    key = f"part:{int(e.exr_part)}"
-                    name = str(e.exr_name or "-")
-
-                raw, val = _format_value(e, max_elements=args.max_elements, max_bytes=args.max_bytes)
-                raw = _truncate_cell(raw, args.max_cell_chars)
-                val = _truncate_cell(val, args.max_cell_chars)
-
-                print(
-                    f"{idx:4d} | {_truncate_cell(key, 12):<12} | {_truncate_cell(name, 14):<14} | "
-                    f"{_truncate_cell(_val_type(e), 10):<10} | {raw:<30} | {val}"
-                )
-            print("=" * width)
+        write(f"{l1}\n{l2}\n{openmeta.python_info_line()}\n")
 
+    jobs = args.jobs if args.jobs > 0 else min(8, os.cpu_count() or 1)
+    if jobs > 1 and len(args.files) > 1:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(args.files))) as pool:
+            try:
+                for text in pool.map(_format_file, args.files, itertools.repeat(args)):
+                    write(text)
+            except BaseException:
+                # Fail fast like serial mode: drop the files not started yet.
+                pool.shutdown(wait=True, cancel_futures=True)
+                raise
+        return 0
+
+    files = args.files
+    for i, path in enumerate(files):
+        _dump_file(path, args, write, files[i + 1] if i + 1 < len(files) else None)
     return 0
 
 
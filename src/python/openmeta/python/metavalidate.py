@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import sys
 
@@ -18,6 +19,7 @@ except ModuleNotFoundError:
     raise SystemExit(2)
 
 
+@functools.lru_cache(maxsize=1024)
 def _snake(name: str) -> str:
     out = []
     for i, ch in enumerate(name):
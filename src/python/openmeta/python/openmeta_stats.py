@@ -3,9 +3,15 @@
 from __future__ import annotations
 
 import argparse
+import functools
+import io
+import os
 import re
 import sys
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import compress, repeat
+from typing import Optional, TextIO
 
 try:
     import openmeta
@@ -19,8 +25,120 @@ except ModuleNotFoundError:
     raise SystemExit(2)
 
 
+_SNAKE_RE = re.compile(r"(?<!^)(?=[A-Z])")
+
+
+@functools.lru_cache(maxsize=1024)
 def _snake(name: str) -> str:
-    return re.sub(r"(?<!^)([A-Z])", r"_\1", name).lower()
+    return _SNAKE_RE.sub("_", name).lower()
+
+
+def _print_stats(path: str, args: argparse.Namespace, out: TextIO, next_path: Optional[str] = None) -> None:
+    doc = openmeta.read(
+        path,
+        include_pointer_tags=not args.fast,
+        decompress=not args.fast,
+        include_xmp_sidecar=bool(args.xmp_sidecar),
+        max_file_bytes=int(args.max_file_bytes),
+    )
+    if next_path is not None:
+        _prefetch(next_path, int(args.max_file_bytes))
+
+    print(f"== {path}", file=out)
+    print(f"size={doc.file_size}", file=out)
+    print(f"scan={_snake(doc.scan_status.name)} blocks={len(doc.blocks)}", file=out)
+    print(
+        f"exif={_snake(doc.exif_status.name)} ifds_decoded={doc.exif_ifds_decoded} "
+        f"exr={_snake(doc.exr_status.name)} exr_parts={doc.exr_parts_decoded} exr_entries={doc.exr_entries_decoded} "
+        f"xmp={_snake(doc.xmp_status.name)} xmp_entries={doc.xmp_entries_decoded} "
+        f"entries={doc.entry_count} blocks={doc.block_count}",
+        file=out,
+    )
+    if (
+        doc.exif_status == openmeta.ExifDecodeStatus.LimitExceeded
+        and doc.exif_limit_reason != openmeta.ExifLimitReason.None_
+    ):
+        print(
+            "exif_limit "
+            f"reason={_snake(doc.exif_limit_reason.name)} "
+            f"ifd_off={int(doc.exif_limit_ifd_offset)} "
+            f"tag=0x{int(doc.exif_limit_tag):04X}",
+            file=out,
+        )
+
+    fmt_counts = Counter(_snake(b.format.name) for b in doc.blocks)
+    kind_counts = Counter(_snake(b.kind.name) for b in doc.blocks)
+    comp_counts = Counter(_snake(b.compression.name) for b in doc.blocks)
+
+    if doc.blocks:
+        print("container_formats:", ", ".join(f"{k}={v}" for k, v in sorted(fmt_counts.items())), file=out)
+        print("block_kinds:", ", ".join(f"{k}={v}" for k, v in sorted(kind_counts.items())), file=out)
+        print("compressions:", ", ".join(f"{k}={v}" for k, v in sorted(comp_counts.items())), file=out)
+
+    if doc.entry_count:
+        # One call for all entries instead of per-entry attribute lookups.
+        cols = doc.entries_bulk()
+        exif_tag = openmeta.MetaKeyKind.ExifTag
+        is_exif = [key_kind == exif_tag for key_kind in cols["key_kind"]]
+
+        # ifd/tag are always set for ExifTag entries. Counters are built
+        # from whole columns so the tallying runs in C.
+        ifds = list(compress(cols["ifd"], is_exif))
+        tags = list(compress(cols["tag"], is_exif))
+        ifd_counts = Counter(ifds)
+        # (ifd, tag) keys are packed as (ifd_code << 16) | tag, where
+        # ifd_code indexes ifd_names; no per-entry tuples are created.
+        ifd_names = list(ifd_counts)
+        ifd_codes = {ifd: code for code, ifd in enumerate(ifd_names)}
+        tag_counts = Counter((ifd_codes[i] << 16) | t for i, t in zip(ifds, tags))
+        unknown_names = list(compress(cols["has_name"], is_exif)).count(False)
+        # Tallied by enum member; names are only formatted for output.
+        value_kinds = Counter(compress(cols["value_kind"], is_exif))
+        elem_types = Counter(compress(cols["elem_type"], is_exif))
+
+        dups = [(k, v) for (k, v) in tag_counts.items() if v > 1]
+
+        print("ifds:", ", ".join(f"{k}={v}" for k, v in sorted(ifd_counts.items())), file=out)
+        print(f"unknown_tag_names={unknown_names}", file=out)
+        print(f"duplicate_tags={len(dups)}", file=out)
+        if dups:
+            dups.sort(key=lambda x: x[1], reverse=True)
+            top = dups[:10]
+            print(
+                "top_duplicates:",
+                ", ".join(f"{ifd_names[key >> 16]}:0x{key & 0xFFFF:04X}={cnt}" for (key, cnt) in top),
+                file=out,
+            )
+
+        value_kind_counts = sorted((_snake(k.name), v) for k, v in value_kinds.items())
+        elem_type_counts = sorted((_snake(k.name), v) for k, v in elem_types.items())
+        print("value_kinds:", ", ".join(f"{k}={v}" for k, v in value_kind_counts), file=out)
+        print("elem_types:", ", ".join(f"{k}={v}" for k, v in elem_type_counts), file=out)
+
+
+def _format_stats(path: str, args: argparse.Namespace) -> str:
+    buf = io.StringIO()
+    _print_stats(path, args, buf)
+    return buf.getvalue()
+
+
+_PREFETCH_BYTES = 1 << 20
+
+
+def _prefetch(path: str, max_file_bytes: int) -> None:
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        length = _PREFETCH_BYTES if max_file_bytes <= 0 else min(_PREFETCH_BYTES, max_file_bytes)
+        os.posix_fadvise(fd, 0, length, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
 
 
 def main(argv: list[str]) -> int:
@@ -29,7 +147,20 @@ def main(argv: list[str]) -> int:
     ap.add_argument("--no-build-info", action="store_true", help="hide OpenMeta build info header")
     ap.add_argument("--xmp-sidecar", action="store_true", help="also read sidecar XMP (<file>.xmp, <basename>.xmp)")
     ap.add_argument("--max-file-bytes", type=int, default=0)
+    ap.add_argument(
+        "--fast",
+        action="store_true",
+        help="skip pointer tags and compressed payload decoding (counts cover uncompressed metadata only)",
+    )
+    ap.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="worker processes for multiple files (0=min(8, cpu count)); output stays in input order",
+    )
     args = ap.parse_args(argv)
+    if args.jobs < 0:
+        ap.error("--jobs must be >= 0")
 
     if not args.no_build_info:
         l1, l2 = openmeta.info_lines()
@@ -37,78 +168,20 @@ def main(argv: list[str]) -> int:
         print(l2)
         print(openmeta.python_info_line())
 
-    for path in args.files:
-        doc = openmeta.read(
-            path,
-            include_xmp_sidecar=bool(args.xmp_sidecar),
-            max_file_bytes=int(args.max_file_bytes),
-        )
-
-        print(f"== {path}")
-        print(f"size={doc.file_size}")
-        print(f"scan={_snake(doc.scan_status.name)} blocks={len(doc.blocks)}")
-        print(
-            f"exif={_snake(doc.exif_status.name)} ifds_decoded={doc.exif_ifds_decoded} "
-            f"exr={_snake(doc.exr_status.name)} exr_parts={doc.exr_parts_decoded} exr_entries={doc.exr_entries_decoded} "
-            f"xmp={_snake(doc.xmp_status.name)} xmp_entries={doc.xmp_entries_decoded} "
-            f"entries={doc.entry_count} blocks={doc.block_count}"
-        )
-        if (
-            doc.exif_status == openmeta.ExifDecodeStatus.LimitExceeded
-            and doc.exif_limit_reason != openmeta.ExifLimitReason.None_
-        ):
-            print(
-                "exif_limit "
-                f"reason={_snake(doc.exif_limit_reason.name)} "
-                f"ifd_off={int(doc.exif_limit_ifd_offset)} "
-                f"tag=0x{int(doc.exif_limit_tag):04X}"
-            )
-
-        fmt_counts = Counter(_snake(b.format.name) for b in doc.blocks)
-        kind_counts = Counter(_snake(b.kind.name) for b in doc.blocks)
-        comp_counts = Counter(_snake(b.compression.name) for b in doc.blocks)
-
-        if doc.blocks:
-            print("container_formats:", ", ".join(f"{k}={v}" for k, v in sorted(fmt_counts.items())))
-            print("block_kinds:", ", ".join(f"{k}={v}" for k, v in sorted(kind_counts.items())))
-            print("compressions:", ", ".join(f"{k}={v}" for k, v in sorted(comp_counts.items())))
-
-        if doc.entry_count:
-            ifd_counts = Counter()
-            tag_counts = Counter()
-            unknown_names = 0
-            value_kinds = Counter()
-            elem_types = Counter()
-
-            for i in range(int(doc.entry_count)):
-                e = doc[i]
-                if e.key_kind != openmeta.MetaKeyKind.ExifTag:
-                    continue
-
-                ifd = str(e.ifd or "")
-                tag = int(e.tag or 0)
-                ifd_counts[ifd] += 1
-                tag_counts[(ifd, tag)] += 1
-                if e.name is None:
-                    unknown_names += 1
-                value_kinds[_snake(e.value_kind.name)] += 1
-                elem_types[_snake(e.elem_type.name)] += 1
-
-            dups = [(k, v) for (k, v) in tag_counts.items() if v > 1]
-
-            print("ifds:", ", ".join(f"{k}={v}" for k, v in sorted(ifd_counts.items())))
-            print(f"unknown_tag_names={unknown_names}")
-            print(f"duplicate_tags={len(dups)}")
-            if dups:
-                dups.sort(key=lambda x: x[1], reverse=True)
-                top = dups[:10]
-                print(
-                    "top_duplicates:",
-                    ", ".join(f"{ifd}:0x{tag:04X}={cnt}" for ((ifd, tag), cnt) in top),
-                )
-
-            print("value_kinds:", ", ".join(f"{k}={v}" for k, v in sorted(value_kinds.items())))
-            print("elem_types:", ", ".join(f"{k}={v}" for k, v in sorted(elem_types.items())))
+    jobs = args.jobs if args.jobs > 0 else min(8, os.cpu_count() or 1)
+    if jobs > 1 and len(args.files) > 1:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(args.files))) as pool:
+            try:
+                for text in pool.map(_format_stats, args.files, repeat(args)):
+                    sys.stdout.write(text)
+            except BaseException:
+                pool.shutdown(wait=True, cancel_futures=True)
+                raise
+        return 0
+
+    files = args.files
+    for i, path in enumerate(files):
+        _print_stats(path, args, sys.stdout, files[i + 1] if i + 1 < len(files) else None)
 
     return 0
 
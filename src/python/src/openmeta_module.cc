@@ -4598,6 +4598,93 @@ struct PyEntry final {
     EntryId id = kInvalidEntryId;
 };
 
+// Entry.name: the display name for keys that have one, else None.
+static nb::object
+entry_name_object(const PyEntry& e)
+{
+    const Entry& en = e.doc->store.entry(e.id);
+    if (en.key.kind == MetaKeyKind::ExifTag) {
+        const std::string_view n
+            = exif_entry_name(e.doc->store, en,
+                              ExifTagNamePolicy::ExifToolCompat);
+        if (n.empty()) {
+            return nb::none();
+        }
+        return nb::str(n.data(), n.size());
+    }
+    if (en.key.kind == MetaKeyKind::Comment) {
+        return nb::str("comment");
+    }
+    if (en.key.kind == MetaKeyKind::GeotiffKey) {
+        const std::string_view n = geotiff_key_name(
+            en.key.data.geotiff_key.key_id);
+        if (n.empty()) {
+            return nb::none();
+        }
+        return nb::str(n.data(), n.size());
+    }
+    if (en.key.kind == MetaKeyKind::IccTag) {
+        const std::string_view n = icc_tag_name(
+            en.key.data.icc_tag.signature);
+        if (n.empty()) {
+            return nb::none();
+        }
+        return nb::str(n.data(), n.size());
+    }
+    if (en.key.kind == MetaKeyKind::ExrAttribute) {
+        const std::string s
+            = arena_string(e.doc->store.arena(),
+                           en.key.data.exr_attribute.name);
+        return nb::str(s.c_str(), s.size());
+    }
+    if (en.key.kind == MetaKeyKind::PhotoshopIrbField) {
+        const std::string s
+            = arena_string(e.doc->store.arena(),
+                           en.key.data.photoshop_irb_field.field);
+        return nb::str(s.c_str(), s.size());
+    }
+    if (en.key.kind == MetaKeyKind::BmffField) {
+        const std::string s
+            = arena_string(e.doc->store.arena(),
+                           en.key.data.bmff_field.field);
+        return nb::str(s.c_str(), s.size());
+    }
+    if (en.key.kind == MetaKeyKind::JumbfField) {
+        const std::string s
+            = arena_string(e.doc->store.arena(),
+                           en.key.data.jumbf_field.field);
+        return nb::str(s.c_str(), s.size());
+    }
+    if (en.key.kind == MetaKeyKind::JumbfCborKey) {
+        const std::string s
+            = arena_string(e.doc->store.arena(),
+                           en.key.data.jumbf_cbor_key.key);
+        return nb::str(s.c_str(), s.size());
+    }
+    if (en.key.kind == MetaKeyKind::PngText) {
+        const std::string s
+            = arena_string(e.doc->store.arena(),
+                           en.key.data.png_text.keyword);
+        return nb::str(s.c_str(), s.size());
+    }
+    return nb::none();
+}
+
+// Entry.snapshot(): the fields metaread reads per row, fetched in one call.
+struct PyEntrySnapshot final {
+    MetaKeyKind key_kind       = MetaKeyKind::ExifTag;
+    MetaValueKind value_kind   = MetaValueKind::Empty;
+    MetaElementType elem_type  = MetaElementType::U8;
+    uint16_t wire_type_code    = 0;
+    uint32_t wire_count        = 0;
+    nb::object tag             = nb::none();
+    nb::object name            = nb::none();
+    nb::object ifd             = nb::none();
+    BlockId origin_block       = kInvalidBlockId;
+    uint32_t origin_order      = 0;
+    uint32_t count             = 0;
+};
+
 static std::shared_ptr<PyDocument>
 read_document(const std::string& path, bool include_pointer_tags,
               bool decode_makernote, bool decompress, bool include_xmp_sidecar,
@@ -5845,6 +5932,74 @@ NB_MODULE(_openmeta, m)
              [](const PyDocument& d) {
                  return static_cast<uint64_t>(d.store.entries().size());
              })
+        .def("entries",
+             [](std::shared_ptr<PyDocument> d) {
+                 const size_t n = d->store.entries().size();
+                 std::vector<PyEntry> out;
+                 out.reserve(n);
+                 for (size_t i = 0; i < n; ++i) {
+                     PyEntry e;
+                     e.doc = d;
+                     e.id  = static_cast<EntryId>(i);
+                     out.push_back(std::move(e));
+                 }
+                 return out;
+             })
+        .def(
+            "entries_bulk",
+            [](const PyDocument& d, bool names) {
+                nb::list key_kind;
+                nb::list ifd;
+                nb::list tag;
+                nb::list has_name;
+                nb::list value_kind;
+                nb::list elem_type;
+                nb::list origin_block;
+                nb::list origin_order;
+                for (const Entry& en : d.store.entries()) {
+                    key_kind.append(en.key.kind);
+                    if (en.key.kind == MetaKeyKind::ExifTag) {
+                        const std::string s
+                            = arena_string(d.store.arena(),
+                                           en.key.data.exif_tag.ifd);
+                        ifd.append(nb::str(s.c_str(), s.size()));
+                        tag.append(nb::int_(en.key.data.exif_tag.tag));
+                        // The name lookup is the costly part; skip it
+                        // unless the caller asked for has_name.
+                        if (names) {
+                            has_name.append(nb::bool_(
+                                !exif_entry_name(
+                                     d.store, en,
+                                     ExifTagNamePolicy::ExifToolCompat)
+                                     .empty()));
+                        }
+                    } else {
+                        ifd.append(nb::none());
+                        tag.append(nb::none());
+                        if (names) {
+                            has_name.append(nb::bool_(false));
+                        }
+                    }
+                    value_kind.append(en.value.kind);
+                    elem_type.append(en.value.elem_type);
+                    origin_block.append(nb::int_(en.origin.block));
+                    origin_order.append(nb::int_(en.origin.order_in_block));
+                }
+
+                nb::dict out;
+                out["key_kind"]     = std::move(key_kind);
+                out["ifd"]          = std::move(ifd);
+                out["tag"]          = std::move(tag);
+                if (names) {
+                    out["has_name"] = std::move(has_name);
+                }
+                out["value_kind"]   = std::move(value_kind);
+                out["elem_type"]    = std::move(elem_type);
+                out["origin_block"] = std::move(origin_block);
+                out["origin_order"] = std::move(origin_order);
+                return out;
+            },
+            "names"_a = true)
         .def(
             "find_exif",
             [](std::shared_ptr<PyDocument> d, const std::string& ifd,
@@ -5902,6 +6057,19 @@ NB_MODULE(_openmeta, m)
             return e;
         });
 
+    nb::class_<PyEntrySnapshot>(m, "EntrySnapshot")
+        .def_ro("key_kind", &PyEntrySnapshot::key_kind)
+        .def_ro("value_kind", &PyEntrySnapshot::value_kind)
+        .def_ro("elem_type", &PyEntrySnapshot::elem_type)
+        .def_ro("wire_type_code", &PyEntrySnapshot::wire_type_code)
+        .def_ro("wire_count", &PyEntrySnapshot::wire_count)
+        .def_ro("tag", &PyEntrySnapshot::tag)
+        .def_ro("name", &PyEntrySnapshot::name)
+        .def_ro("ifd", &PyEntrySnapshot::ifd)
+        .def_ro("origin_block", &PyEntrySnapshot::origin_block)
+        .def_ro("origin_order", &PyEntrySnapshot::origin_order)
+        .def_ro("count", &PyEntrySnapshot::count);
+
     nb::class_<PyEntry>(m, "Entry")
         .def_prop_ro("key_kind",
                      [](const PyEntry& e) {
@@ -6053,76 +6221,29 @@ NB_MODULE(_openmeta, m)
                                             en.key.data.png_text.field);
                          return nb::str(s.c_str(), s.size());
                      })
-        .def_prop_ro(
-            "name",
-            [](const PyEntry& e) -> nb::object {
-                const Entry& en = e.doc->store.entry(e.id);
-                if (en.key.kind == MetaKeyKind::ExifTag) {
-                    const std::string_view n
-                        = exif_entry_name(e.doc->store, en,
-                                          ExifTagNamePolicy::ExifToolCompat);
-                    if (n.empty()) {
-                        return nb::none();
-                    }
-                    return nb::str(n.data(), n.size());
-                }
-                if (en.key.kind == MetaKeyKind::Comment) {
-                    return nb::str("comment");
-                }
-                if (en.key.kind == MetaKeyKind::GeotiffKey) {
-                    const std::string_view n = geotiff_key_name(
-                        en.key.data.geotiff_key.key_id);
-                    if (n.empty()) {
-                        return nb::none();
-                    }
-                    return nb::str(n.data(), n.size());
-                }
-                if (en.key.kind == MetaKeyKind::IccTag) {
-                    const std::string_view n = icc_tag_name(
-                        en.key.data.icc_tag.signature);
-                    if (n.empty()) {
-                        return nb::none();
-                    }
-                    return nb::str(n.data(), n.size());
-                }
-                if (en.key.kind == MetaKeyKind::ExrAttribute) {
-                    const std::string s
-                        = arena_string(e.doc->store.arena(),
-                                       en.key.data.exr_attribute.name);
-                    return nb::str(s.c_str(), s.size());
-                }
-                if (en.key.kind == MetaKeyKind::PhotoshopIrbField) {
-                    const std::string s
-                        = arena_string(e.doc->store.arena(),
-                                       en.key.data.photoshop_irb_field.field);
-                    return nb::str(s.c_str(), s.size());
-                }
-                if (en.key.kind == MetaKeyKind::BmffField) {
-                    const std::string s
-                        = arena_string(e.doc->store.arena(),
-                                       en.key.data.bmff_field.field);
-                    return nb::str(s.c_str(), s.size());
-                }
-                if (en.key.kind == MetaKeyKind::JumbfField) {
-                    const std::string s
-                        = arena_string(e.doc->store.arena(),
-                                       en.key.data.jumbf_field.field);
-                    return nb::str(s.c_str(), s.size());
-                }
-                if (en.key.kind == MetaKeyKind::JumbfCborKey) {
-                    const std::string s
-                        = arena_string(e.doc->store.arena(),
-                                       en.key.data.jumbf_cbor_key.key);
-                    return nb::str(s.c_str(), s.size());
-                }
-                if (en.key.kind == MetaKeyKind::PngText) {
-                    const std::string s
-                        = arena_string(e.doc->store.arena(),
-                                       en.key.data.png_text.keyword);
-                    return nb::str(s.c_str(), s.size());
-                }
-                return nb::none();
-            })
+        .def_prop_ro("name", &entry_name_object)
+        .def("snapshot",
+             [](const PyEntry& e) {
+                 const Entry& en = e.doc->store.entry(e.id);
+                 PyEntrySnapshot out;
+                 out.key_kind       = en.key.kind;
+                 out.value_kind     = en.value.kind;
+                 out.elem_type      = en.value.elem_type;
+                 out.wire_type_code = en.origin.wire_type.code;
+                 out.wire_count     = en.origin.wire_count;
+                 out.name           = entry_name_object(e);
+                 out.origin_block   = en.origin.block;
+                 out.origin_order   = en.origin.order_in_block;
+                 out.count          = en.value.count;
+                 if (en.key.kind == MetaKeyKind::ExifTag) {
+                     out.tag = nb::int_(en.key.data.exif_tag.tag);
+                     const std::string s
+                         = arena_string(e.doc->store.arena(),
+                                        en.key.data.exif_tag.ifd);
+                     out.ifd = nb::str(s.c_str(), s.size());
+                 }
+                 return out;
+             })
         .def_prop_ro("value_kind",
                      [](const PyEntry& e) {
                          return e.doc->store.entry(e.id).value.kind;
@@ -7593,6 +7714,56 @@ NB_MODULE(_openmeta, m)
     m.def("hex_bytes", &hex_bytes, "data"_a, "max_bytes"_a = 4096U);
     m.def("unsafe_text", &unsafe_text, "data"_a, "max_bytes"_a = 4096U);
     m.def("unsafe_test", &unsafe_text, "data"_a, "max_bytes"_a = 4096U);
+    m.def(
+        "format_all_bytes",
+        [](const std::vector<PyEntry>& entries, uint32_t max_bytes) {
+            nb::list out;
+            for (const PyEntry& e : entries) {
+                const Entry& en = e.doc->store.entry(e.id);
+                if (en.value.kind != MetaValueKind::Text
+                    && en.value.kind != MetaValueKind::Bytes) {
+                    out.append(nb::none());
+                    continue;
+                }
+                // Same truncation as Entry.value(max_bytes=...).
+                std::span<const std::byte> bytes = e.doc->store.arena().span(
+                    en.value.data.span);
+                if (max_bytes != 0U && bytes.size() > max_bytes) {
+                    bytes = bytes.first(max_bytes);
+                }
+                // Only build the forms metaread prints: hex for Bytes values
+                // and IPTC/ICC-header keys, console text for Text values and
+                // IPTC keys. Skipped forms are None.
+                const bool iptc = en.key.kind == MetaKeyKind::IptcDataset;
+                const bool need_hex
+                    = en.value.kind == MetaValueKind::Bytes || iptc
+                      || en.key.kind == MetaKeyKind::IccHeaderField;
+                const bool need_text = en.value.kind == MetaValueKind::Text
+                                       || iptc;
+                nb::object hex  = nb::none();
+                nb::object text = nb::none();
+                bool dangerous  = false;
+                if (need_hex) {
+                    std::string s;
+                    s.append("0x");
+                    append_hex_bytes(bytes, max_bytes, &s);
+                    hex = nb::str(s.c_str(), s.size());
+                }
+                if (need_text) {
+                    std::string s;
+                    dangerous = append_console_escaped_ascii(
+                        std::string_view(reinterpret_cast<const char*>(
+                                             bytes.data()),
+                                         bytes.size()),
+                        max_bytes, &s);
+                    text = nb::str(s.c_str(), s.size());
+                }
+                out.append(nb::make_tuple(std::move(hex), std::move(text),
+                                          dangerous));
+            }
+            return out;
+        },
+        "entries"_a, "max_bytes"_a = 4096U);
 
     m.def("build_info", []() {
         const BuildInfo& bi = build_info();
@@ -176,6 +176,49 @@ assert module_snapshot.entry_count == r['entry_count'], module_snapshot
 doc_dump = openmeta.read(str(p)).compatibility_dump(max_value_bytes=32)
 assert 'style=\"flat_host\"' in doc_dump, doc_dump
 
+doc = openmeta.read(str(p))
+doc_entries = doc.entries()
+assert len(doc_entries) == doc.entry_count, doc_entries
+assert [e.key_kind for e in doc_entries] == [doc[i].key_kind for i in range(doc.entry_count)], doc_entries
+cols = doc.entries_bulk()
+assert set(cols) == {'key_kind', 'ifd', 'tag', 'has_name', 'value_kind', 'elem_type', 'origin_block', 'origin_order'}, cols
+assert all(len(c) == doc.entry_count for c in cols.values()), cols
+dt = doc.find_exif('ifd0', 0x0132)[0]
+dt_pos = [i for i in range(doc.entry_count) if cols['tag'][i] == 0x0132][0]
+assert cols['ifd'][dt_pos] == 'ifd0', cols
+assert cols['has_name'][dt_pos] is True, cols
+assert cols['value_kind'][dt_pos] == dt.value_kind, cols
+assert cols['origin_block'][dt_pos] == dt.origin_block, cols
+assert cols['origin_order'][dt_pos] == dt.origin_order, cols
+assert 'has_name' not in doc.entries_bulk(names=False), cols
+
+snap = dt.snapshot()
+assert (snap.key_kind, snap.value_kind, snap.elem_type) == (dt.key_kind, dt.value_kind, dt.elem_type), snap
+assert (snap.wire_type_code, snap.wire_count, snap.count) == (2, 20, dt.count), snap
+assert (snap.tag, snap.name, snap.ifd) == (0x0132, dt.name, 'ifd0'), snap
+assert (snap.origin_block, snap.origin_order) == (dt.origin_block, dt.origin_order), snap
+
+forms = openmeta.format_all_bytes([dt], 8)
+dt_bytes = dt.value(max_bytes=8)
+assert forms[0] == (None,) + tuple(openmeta.console_text(dt_bytes, max_bytes=8)), forms
+
+icc_doc = openmeta.read(str(p_icc))
+icc_entries = icc_doc.entries()
+icc_cols = icc_doc.entries_bulk()
+assert all(len(c) == icc_doc.entry_count for c in icc_cols.values()), icc_cols
+assert all(k != openmeta.MetaKeyKind.ExifTag for k in icc_cols['key_kind']), icc_cols
+assert icc_cols['ifd'] == [None] * icc_doc.entry_count, icc_cols
+assert icc_cols['tag'] == [None] * icc_doc.entry_count, icc_cols
+assert icc_cols['has_name'] == [False] * icc_doc.entry_count, icc_cols
+icc_forms = openmeta.format_all_bytes(icc_entries, 8)
+assert len(icc_forms) == len(icc_entries), icc_forms
+desc = [i for i, e in enumerate(icc_entries) if e.key_kind == openmeta.MetaKeyKind.IccTag][0]
+desc_bytes = icc_entries[desc].value(max_bytes=8)
+assert icc_forms[desc] == (openmeta.hex_bytes(desc_bytes, max_bytes=8), None, False), icc_forms
+icc_snap = icc_entries[desc].snapshot()
+assert (icc_snap.tag, icc_snap.ifd) == (None, None), icc_snap
+assert all(f is None for e, f in zip(icc_entries, icc_forms) if e.value_kind == openmeta.MetaValueKind.Scalar), icc_forms
+
 r_snapshot = openmeta.transfer_snapshot_probe(
     snapshot_file['snapshot'],
     format=openmeta.XmpSidecarFormat.Portable,